@@ -36,7 +36,23 @@ Returns:
 - Original input unchanged if parsing fails.
 """
 import re
-from datetime import datetime
+from datetime import date, datetime
+
+# Council format, e.g. "Tuesday, 6th JAN"
+_COUNCIL_RE = re.compile(r"(\w+),\s+(\d{1,2})(st|nd|rd|th)\s+(\w+)")
+
+# Month name -> number, accepting both "Jan" and "January"
+_MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+_MONTHS = {name[:3]: i + 1 for i, name in enumerate(_MONTH_NAMES)}
+_MONTHS.update({name: i + 1 for i, name in enumerate(_MONTH_NAMES)})
+
+
+def _log(message: str) -> None:
+    print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}")
+
 
 def beautify(input_data) -> dict:
 
@@ -47,8 +63,8 @@ def beautify(input_data) -> dict:
         if not isinstance(input_data, dict):
             return original_input
 
-        now = datetime.now()
-        current_year = now.year
+        today = date.today()
+        current_year = today.year
         output = {}
 
         for key, value in input_data.items():
@@ -64,7 +80,7 @@ def beautify(input_data) -> dict:
                 continue
 
             # Match council format
-            m = re.search(r"(\w+),\s+(\d{1,2})(st|nd|rd|th)\s+(\w+)", text)
+            m = _COUNCIL_RE.search(text)
             if not m:
                 output[key] = value
                 continue
@@ -72,23 +88,22 @@ def beautify(input_data) -> dict:
             weekday_full, day, suffix, month_str = m.groups()
             month_norm = month_str.title()
 
-            target_date = None
-            for fmt in ("%d %b %Y", "%d %B %Y"):
-                try:
-                    target_date = datetime.strptime(f"{day} {month_norm} {current_year}", fmt)
-                    break
-                except ValueError:
-                    pass
+            month_num = _MONTHS.get(month_norm)
+            if not month_num:
+                output[key] = value
+                continue
 
-            if not target_date:
+            try:
+                target_date = date(current_year, month_num, int(day))
+            except ValueError:
                 output[key] = value
                 continue
 
             # Year rollover
-            if (target_date.date() - now.date()).days < -30:
+            if (target_date - today).days < -30:
                 target_date = target_date.replace(year=current_year + 1)
 
-            diff = (target_date.date() - now.date()).days
+            diff = (target_date - today).days
             weekday_short = weekday_full[:3]
 
             if diff == 0:
@@ -101,5 +116,5 @@ def beautify(input_data) -> dict:
         return output
 
     except Exception as e:
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: {e}")
+        _log(f"Debug: {e}")
         return original_input
@@ -11,11 +11,55 @@ Non-responsibility (deliberate):
 - It does not display anything.
 - It simply translates chaos into structure.
 """
-from bs4 import BeautifulSoup, Tag
 from datetime import datetime
 
 import re
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+# Prefer selectolax (Lexbor, C) for parsing; fall back to BeautifulSoup
+# if it is not installed.
+SELECTOLAX_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    import soupsieve as sv
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+    # Only build the result blocks; everything else on the page is skipped.
+    # During a parse_only parse bs4 matches class_ against the raw attribute
+    # string, so match the class as a whole word rather than the full value.
+    _STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)rubbish_date_wrap(?:\s|$)"))
+
+    # Selectors are compiled once rather than on every select() call
+    _SEL_BLOCK = sv.compile(".rubbish_date_wrap")
+    _SEL_HEADER = sv.compile('[class*="rubbish_collection_difs_"]')
+    _SEL_DATE = sv.compile(".rubbish_date_container_left_datetext")
+
+# Council date format, e.g. "Tuesday 6 January"
+_DATE_RE = re.compile(
+    r"^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+(\d{1,2})\s+(\w+)$"
+)
+
+# Each result header carries exactly one "rubbish_collection_difs_<colour>" class
+_COLOR_RE = re.compile(r"rubbish_collection_difs_(black|green|purple)")
+_COLOR_TO_KEY = {
+    "black": "Rubbish",
+    "green": "Recycling",
+    "purple": "Food",
+}
+
+
+def _log(message: str) -> None:
+    print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}")
+
+
+def _dump_html(html: str) -> None:
+    _log("Debug: --- HTML START ---")
+    print(html[:5000])
+    _log("Debug: --- HTML END ---")
 
 
 
@@ -37,10 +81,7 @@ Process:
 
 """
 def format_collection_date(raw: str) -> str:
-    m = re.match(
-        r"^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+(\d{1,2})\s+(\w+)$",
-        raw,
-    )
+    m = _DATE_RE.match(raw)
     if not m:
         return raw
 
@@ -56,12 +97,51 @@ def format_collection_date(raw: str) -> str:
 
 
 
+"""
+Finds every '.rubbish_date_wrap' result block and pulls out the two things
+we care about: the header's class string and the raw date text.
+
+Returns:
+- list of (class_str, raw_date) tuples, one per block.
+  Either value is None if the block is missing that element.
+"""
+def _extract_blocks(html: str) -> List[Tuple[Optional[str], Optional[str]]]:
+    blocks: List[Tuple[Optional[str], Optional[str]]] = []
+
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        for block in tree.css(".rubbish_date_wrap"):
+            header = block.css_first('[class*="rubbish_collection_difs_"]')
+            date_el = block.css_first(".rubbish_date_container_left_datetext")
+
+            class_str = header.attributes.get("class", "") if header else None
+            raw_date = date_el.text(strip=True) if date_el else None
+            blocks.append((class_str, raw_date))
+        return blocks
+
+    soup = BeautifulSoup(html, "lxml", parse_only=_STRAINER)
+    for block in _SEL_BLOCK.iselect(soup):
+        header: Tag | None = next(_SEL_HEADER.iselect(block), None)
+        date_el: Tag | None = next(_SEL_DATE.iselect(block), None)
+
+        # Get classes safely as a string for substring searching
+        class_str = None
+        if header:
+            classes = header.get("class", [])
+            class_str = " ".join(classes) if isinstance(classes, list) else str(classes)
+
+        raw_date = date_el.get_text(strip=True) if date_el else None
+        blocks.append((class_str, raw_date))
+    return blocks
+
+
+
 """
 Parses the HTML block returned by the West Berkshire website and extracts
 waste collection dates into a structured dictionary.
 
 Process:
-1. Load the HTML into BeautifulSoup.
+1. Load the HTML (selectolax, or BeautifulSoup + lxml if unavailable).
 2. Locate all result blocks using the '.rubbish_date_wrap' selector.
 3. For each block:
    - Identify the waste type from its CSS class.
@@ -81,60 +161,38 @@ def parse_to_json(html: str) -> dict:
     Parses HTML and returns JSON
     """
     try:
-        soup = BeautifulSoup(html, "html.parser")
         result: Dict[str, str] = {}
 
-        mapping = {
-            "rubbish_collection_difs_black": "Rubbish",
-            "rubbish_collection_difs_green": "Recycling",
-            "rubbish_collection_difs_purple": "Food",
-        }
-
-        blocks = soup.select(".rubbish_date_wrap")
+        blocks = _extract_blocks(html)
         if not blocks:
-            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: No blocks found with selector '.rubbish_date_wrap'.")
-            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: --- HTML START ---")
-            print(html[:5000])
-            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: --- HTML END ---")
+            _log("Debug: No blocks found with selector '.rubbish_date_wrap'.")
+            _dump_html(html)
             
             return {"Error": "Invalid HTML"}
 
-        for block in blocks:
-            header: Tag | None = block.select_one("[class*=rubbish_collection_difs_]")
-            date_el: Tag | None = block.select_one(".rubbish_date_container_left_datetext")
-
-            if not header or not date_el:
+        for class_str, raw_date in blocks:
+            if class_str is None or raw_date is None:
                 continue
 
-            # Get classes safely as a string for substring searching
-            classes = header.get("class", [])
-            class_str = " ".join(classes) if isinstance(classes, list) else str(classes)
-
-            for css_class, key in mapping.items():
-                if css_class in class_str:
-                    raw_date = date_el.get_text(strip=True)
-                    result[key] = format_collection_date(raw_date)
+            m = _COLOR_RE.search(class_str)
+            if m:
+                result[_COLOR_TO_KEY[m.group(1)]] = format_collection_date(raw_date)
 
         # Ensure we actually found data before returning
         if not result:
             
-            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: Found containers, but mapping failed.")
-            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: --- HTML START ---")
-            print(html[:5000])
-            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: --- HTML END ---")
-            for i, block in enumerate(blocks):
+            _log("DEBUG: Found containers, but mapping failed.")
+            _dump_html(html)
+            for i, (class_str, _) in enumerate(blocks):
                 # Print the classes found on the header to see why mapping failed
-                header = block.select_one("[class*=rubbish_collection_difs_]")
-                found_classes = header.get("class") if header else "No Header Found"
-                print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Block {i} classes: {found_classes}")
+                found_classes = class_str if class_str is not None else "No Header Found"
+                _log(f"Block {i} classes: {found_classes}")
                 
             return {"Error": "JSON Mapping"}
 
         return result
 
     except Exception as e:
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: {e}")
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: --- HTML START ---")
-        print(html[:5000])
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] Debug: --- HTML END ---")
+        _log(f"Debug: {e}")
+        _dump_html(html)
         return {"Error": "Exception"}
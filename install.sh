@@ -204,6 +204,12 @@ fi
 log " -> Installing spidev (pip, PEP 668 override)"
 python3 -m pip install --break-system-packages spidev
 
+log " -> Installing selectolax (pip, PEP 668 override)"
+python3 -m pip install --break-system-packages selectolax
+
+log " -> Installing BeautifulSoup + lxml (pip, PEP 668 override)"
+python3 -m pip install --break-system-packages beautifulsoup4 lxml
+
 log " -> Installing Playwright (pip, PEP 668 override)"
 python3 -m pip install --break-system-packages playwright
 
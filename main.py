@@ -42,7 +42,7 @@ from typing import Dict, Union
 from website_scraper import scrape_url_get_html
 from html_to_json import parse_to_json
 from beautify_json import beautify
-from output import show_result
+from output import show_result, start_prewarm
 
 VERSION = "1-0"
 URL = "https://www.westberks.gov.uk/article/35776/Find-your-next-collection-day"
@@ -55,6 +55,9 @@ def main() -> None:
     
     updated = datetime.now()
 
+    # Initialise the e-ink panel in the background while the scrape runs
+    start_prewarm()
+
     # 1) Scrape URL
     print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] [1/4] Scraping URL")
     html_or_error: ResultType = scrape_url_get_html(
@@ -25,6 +25,8 @@ Refresh behaviour:
 - Uses partial refresh most of the time.
 - Forces periodic full refresh to reduce ghosting.
 - Rate-limits updates to protect the panel.
+- start_prewarm() runs the full-refresh init on a background thread
+  (e.g. while scraping) so show_result() does not have to wait for it.
 
 Input:
 - result: dict of collection values OR error dict.
@@ -41,6 +43,7 @@ import datetime
 import os
 import socket
 import sys
+import threading
 import time
 from typing import Dict, Optional, Union
 
@@ -65,10 +68,19 @@ try:
     epd2in13_V4 = _epd2in13_V4
     EPD_AVAILABLE = True
 except Exception as e:
-    print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: Waveshare import failed: {type(e).__name__}: {e}")
+    print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: Waveshare import failed: {type(e).__name__}: {e}")
     EPD_AVAILABLE = False
     epd2in13_V4 = None
 
+# One driver instance for the whole process; init() is still called per refresh
+_EPD = epd2in13_V4.EPD() if EPD_AVAILABLE and epd2in13_V4 is not None else None
+
+# Driver capabilities differ between Waveshare revisions; resolve them once.
+# FULL_UPDATE is 0 on some drivers, so compare against None, not truthiness.
+_FULL_MODE = getattr(_EPD, "FULL_UPDATE", None)
+_PART_MODE = getattr(_EPD, "PART_UPDATE", getattr(_EPD, "PARTIAL_UPDATE", None))
+_DISPLAY_PARTIAL = getattr(_EPD, "displayPartial", _EPD.display) if _EPD is not None else None
+
 # -------------------- Display constants --------------------
 
 WIDTH = 250
@@ -88,11 +100,27 @@ HEADER_GAP = 12
 
 LABEL_COL_X = LEFT_MARGIN
 DATE_COL_X = 92  # fixed alignment for values
+BODY_TOP_Y = TOP_MARGIN + HEADER_SIZE + HEADER_GAP
+
+RESULT_LABELS = ("Rubbish:", "Recycling:", "Food:")
+ERROR_LABELS = ("Error:", "", "")
 
 # ePaper refresh control
 FULL_REFRESH_INTERVAL_SECONDS = 30 * 60
 PARTIAL_REFRESH_LIMIT = 50
 MIN_REFRESH_SECONDS = 2
+PREWARM_WAIT_SECONDS = 10
+
+# Local IP lookup (footer) is cached between refreshes
+IP_CACHE_SECONDS = 5 * 60
+IP_LOOKUP_TIMEOUT_SECONDS = 0.5
+_IP_CACHE: Dict[str, object] = {"ip": None, "ts": 0.0}
+
+# Prewarm state: started -> thread launched, done -> thread finished
+# (success or failure), ready -> full init succeeded
+_prewarm_started = threading.Event()
+_prewarm_done = threading.Event()
+_prewarm_ready = threading.Event()
 
 _last_full_refresh: Optional[float] = None
 _partial_count: int = 0
@@ -126,28 +154,105 @@ def _load_fonts() -> tuple[ImageFont.ImageFont, ImageFont.ImageFont, ImageFont.I
 HEADER_FONT, ROW_FONT, FOOTER_FONT = _load_fonts()
 
 
+def _build_base(labels: tuple[str, ...]) -> Image.Image:
+    # Static parts of the frame: header and label column
+    image = Image.new("1", (WIDTH, HEIGHT), 1)
+    draw = ImageDraw.Draw(image)
+
+    draw.text((LEFT_MARGIN, TOP_MARGIN), "Waste Collection", font=HEADER_FONT, fill=0)
+
+    y = BODY_TOP_Y
+    for label in labels:
+        if label:
+            draw.text((LABEL_COL_X, y), label, font=ROW_FONT, fill=0)
+        y += ROW_SIZE + ROW_GAP
+
+    return image
+
+
+# Rebuild these if the fonts are ever reloaded
+_BASE = _build_base(RESULT_LABELS)
+_ERROR_BASE = _build_base(ERROR_LABELS)
+
+# One frame and Draw reused across refreshes; the base is pasted in each time
+_FRAME = Image.new("1", (WIDTH, HEIGHT), 1)
+_FRAME_DRAW = ImageDraw.Draw(_FRAME)
+
+# multiline_text() advances each line by the height of "A" plus `spacing`.
+# Pick spacing so the value rows land on the same pitch as the labels.
+_ROW_SPACING = ROW_SIZE + ROW_GAP - _FRAME_DRAW.textbbox((0, 0), "A", font=ROW_FONT)[3]
+
+
 def _get_local_ip() -> str:
+    now = time.time()
+    if _IP_CACHE["ip"] and (now - _IP_CACHE["ts"]) < IP_CACHE_SECONDS:
+        return _IP_CACHE["ip"]
+
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(IP_LOOKUP_TIMEOUT_SECONDS)
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
-        return ip
     except Exception:
+        # Not cached, so the next refresh tries again
         return "0.0.0.0"
 
+    _IP_CACHE["ip"] = ip
+    _IP_CACHE["ts"] = now
+    return ip
+
 
 def _truncate(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, max_width: int) -> str:
     ellipsis = "..."
     if draw.textlength(text, font=font) <= max_width:
         return text
 
-    out = ""
-    for ch in text:
-        if draw.textlength(out + ch + ellipsis, font=font) > max_width:
-            break
-        out += ch
-    return out + ellipsis
+    # Binary search for the longest prefix that still fits with the ellipsis
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if draw.textlength(text[:mid] + ellipsis, font=font) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + ellipsis
+
+
+def _prewarm_epd() -> None:
+    try:
+        if _FULL_MODE is not None:
+            _EPD.init(_FULL_MODE)
+        else:
+            _EPD.init()
+        _prewarm_ready.set()
+    except Exception as e:
+        print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: ePaper prewarm failed:", repr(e))
+    finally:
+        _prewarm_done.set()
+
+
+def start_prewarm() -> None:
+    """
+    Starts the full-refresh init on a background thread (e.g. while scraping).
+    """
+    if not EPD_AVAILABLE or _EPD is None:
+        return
+
+    # Marked as started before the thread runs, so show_result() can't miss it
+    _prewarm_done.clear()
+    _prewarm_ready.clear()
+    _prewarm_started.set()
+    threading.Thread(target=_prewarm_epd, daemon=True).start()
+
+
+def _wait_for_prewarm() -> bool:
+    # Never touch the panel while a prewarm init is still running on SPI.
+    # Returns False if it is still running after PREWARM_WAIT_SECONDS.
+    if _prewarm_started.is_set() and not _prewarm_done.wait(timeout=PREWARM_WAIT_SECONDS):
+        return False
+    _prewarm_started.clear()
+    return True
 
 
 def show_result(
@@ -204,40 +309,45 @@ def show_result(
 
     print("\n" + footer + "\n")
 
-    if not EPD_AVAILABLE or epd2in13_V4 is None:
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: EPD_AVAILABLE={EPD_AVAILABLE}, epd2in13_V4 is None? {epd2in13_V4 is None}")
+    if not EPD_AVAILABLE or _EPD is None:
+        print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: EPD_AVAILABLE={EPD_AVAILABLE}, epd2in13_V4 is None? {epd2in13_V4 is None}")
         return
 
     # ---------- ePaper rendering ----------
 
-    image = Image.new("1", (WIDTH, HEIGHT), 1)
-    draw = ImageDraw.Draw(image)
-
-    # Header
-    y = TOP_MARGIN
-    draw.text((LEFT_MARGIN, y), "Waste Collection", font=HEADER_FONT, fill=0)
-    y += HEADER_SIZE + HEADER_GAP
-
-    # Body rows
+    # Header and labels come pre-rendered; only the values are drawn here
     if not is_error and isinstance(result, dict):
-        rows = [
-            ("Rubbish:", result.get("Rubbish") or result.get("rubbish") or "-"),
-            ("Recycling:", result.get("Recycling") or result.get("recycling") or "-"),
-            ("Food:", result.get("Food") or result.get("food") or "-"),
+        base = _BASE
+        values = [
+            result.get("Rubbish") or result.get("rubbish") or "-",
+            result.get("Recycling") or result.get("recycling") or "-",
+            result.get("Food") or result.get("food") or "-",
         ]
     else:
-        rows = [
-            ("Error:", error_text or "No data"),
-            ("", ""),
-            ("", ""),
-        ]
+        base = _ERROR_BASE
+        values = [error_text or "No data", "", ""]
+
+    image = _FRAME
+    image.paste(base)
+    draw = _FRAME_DRAW
 
+    # Body rows: all values share DATE_COL_X, so draw them in one call
     max_value_width = WIDTH - RIGHT_MARGIN - DATE_COL_X
-    for label, value in rows:
-        draw.text((LABEL_COL_X, y), label, font=ROW_FONT, fill=0)
-        safe_value = _truncate(draw, str(value), ROW_FONT, max_value_width)
-        draw.text((DATE_COL_X, y), safe_value, font=ROW_FONT, fill=0)
-        y += ROW_SIZE + ROW_GAP
+    safe_values = [_truncate(draw, str(value), ROW_FONT, max_value_width) for value in values]
+    if _ROW_SPACING >= 0:
+        draw.multiline_text(
+            (DATE_COL_X, BODY_TOP_Y),
+            "\n".join(safe_values),
+            font=ROW_FONT,
+            fill=0,
+            spacing=_ROW_SPACING,
+        )
+    else:
+        # Font taller than the row pitch; fall back to one call per row
+        y = BODY_TOP_Y
+        for safe_value in safe_values:
+            draw.text((DATE_COL_X, y), safe_value, font=ROW_FONT, fill=0)
+            y += ROW_SIZE + ROW_GAP
 
     # Footer
     max_footer_width = WIDTH - LEFT_MARGIN - RIGHT_MARGIN
@@ -247,8 +357,16 @@ def show_result(
 
     # ---------- Push to panel ----------
 
+    if not _wait_for_prewarm():
+        print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: ePaper prewarm still running, skipping update")
+        return
+
+    # Only a successful prewarm counts, and only for this refresh
+    prewarmed = _prewarm_ready.is_set()
+    _prewarm_ready.clear()
+
     try:
-        epd = epd2in13_V4.EPD()
+        epd = _EPD
 
         do_full = (
             _last_full_refresh is None
@@ -257,38 +375,32 @@ def show_result(
         )
 
         if do_full:
-            if hasattr(epd, "FULL_UPDATE"):
-                epd.init(epd.FULL_UPDATE)
-            else:
-                epd.init()
+            if not prewarmed:
+                if _FULL_MODE is not None:
+                    epd.init(_FULL_MODE)
+                else:
+                    epd.init()
             epd.display(epd.getbuffer(image))
             _last_full_refresh = now
             _partial_count = 0
         else:
-            if hasattr(epd, "PART_UPDATE"):
-                epd.init(epd.PART_UPDATE)
-            elif hasattr(epd, "PARTIAL_UPDATE"):
-                epd.init(epd.PARTIAL_UPDATE)
+            if _PART_MODE is not None:
+                epd.init(_PART_MODE)
             else:
                 epd.init()
-
-            if hasattr(epd, "displayPartial"):
-                epd.displayPartial(epd.getbuffer(image))
-            else:
-                epd.display(epd.getbuffer(image))
+            _DISPLAY_PARTIAL(epd.getbuffer(image))
             _partial_count += 1
 
         epd.sleep()
 
     except Exception as e:
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: ePaper update failed:", repr(e))
+        print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] DEBUG: ePaper update failed:", repr(e))
 
 
 @atexit.register
 def _cleanup() -> None:
     try:
-        if EPD_AVAILABLE and epd2in13_V4 is not None:
-            epd = epd2in13_V4.EPD()
-            epd.sleep()
+        if EPD_AVAILABLE and _EPD is not None and _wait_for_prewarm():
+            _EPD.sleep()
     except Exception:
         pass
@@ -32,6 +32,7 @@ import atexit
 import datetime
 import os
 import sys
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -60,6 +61,7 @@ WIDTH = 250
 HEIGHT = 122
 
 
+@lru_cache(maxsize=8)
 def _load_font(size: int):
     for path in [
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
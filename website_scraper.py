@@ -24,6 +24,13 @@ Returns:
 - str : HTML content on success.
 - dict: {"error": "..."} if any step fails or times out.
 
+Why a browser (and not plain HTTP):
+The address lookup form is driven by the council's JavaScript. Until the
+endpoint and form fields it posts to are captured from a live session, there
+is nothing stable to call directly, so Chromium stays on the critical path.
+If that endpoint is ever pinned down, a plain HTTP fetch can go in front of
+the Playwright path here, keeping the same signature and return values.
+
 Example HTML:
 <div class="rubbish_date_wrap">     <div class="rubbish_date_container">         <div class="rubbish_date_container_left rubbish_collection_difs_black" style="">             Your next rubbish collection day is             <br>             <div class="rubbish_date_container_left_datetext">Friday 23 January</div>         </div>         <div class="rubbish_date_container_right rubbish_date_container_right_black">             Collection calendar <b>5</b>             <div class="rubbish_date_schedule_desc" style="padding: 15px 25px;">                 <span style="font-size: 22px!important; font-weight: normal;"> Friday every 3 weeks </span>                 <a href="https://www.westberks.gov.uk/media/64437/3-weekly-week-5-calendar/pdf/16320__Calendar_Schedule_5_AW_LR.pdf" target="_blank" title="Download 3 week collection calendar 5" class="media-link media-link--pdf">
           <span class="media-link__text">Collection calendar 5</span>
@@ -44,6 +51,21 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 
 ResultType = Union[str, Dict[str, str]]
 
+# We only read the results DOM, so nothing visual needs to be downloaded
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+def _block_resources(route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+        route.abort()
+    else:
+        route.continue_()
+
 def scrape_url_get_html(url: str, postcode: str, address_value: str, ) -> ResultType:
     try:
         with sync_playwright() as p:
@@ -53,7 +75,11 @@ def scrape_url_get_html(url: str, postcode: str, address_value: str, ) -> Result
                 "--no-sandbox",
                 "--disable-software-rasterizer",
             ])
-            context = browser.new_context()
+            context = browser.new_context(
+                java_script_enabled=True,
+                service_workers="block",
+            )
+            context.route("**/*", _block_resources)
             page = context.new_page()
 
             page.goto(url, wait_until="domcontentloaded", timeout=60000)